@@ -1,113 +1,142 @@
-import tomli
-from pydantic import BaseModel
+import functools
+import os
+from pathlib import Path
 
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-class ServerConfig(BaseModel):
+try:
+    import rtoml  # native parser, ~5x faster than tomli
+except ImportError:
+    rtoml = None
+    import tomli
+
+
+class _FrozenModel(BaseModel):
+    """Shared base: immutable after validation, unknown keys ignored.
+
+    Frozen models are safe to share from the load_config cache, and
+    pydantic skips attribute-set validation entirely. Use
+    `model_copy(update=...)` to derive variants.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class ServerConfig(_FrozenModel):
     host: str = "0.0.0.0"
     port: int = 7860
 
 
-class STTLocalConfig(BaseModel):
+class STTLocalConfig(_FrozenModel):
     model_path: str = "~/.voxaos/models/voxtral-realtime"
 
 
-class STTApiConfig(BaseModel):
+class STTApiConfig(_FrozenModel):
     base_url: str = "https://api.mistral.ai/v1/audio/transcriptions"
     api_key_env: str = "MISTRAL_API_KEY"
 
 
-class STTConfig(BaseModel):
+class STTConfig(_FrozenModel):
     backend: str = "api"
     local: STTLocalConfig = STTLocalConfig()
     api: STTApiConfig = STTApiConfig()
 
 
-class LLMLocalConfig(BaseModel):
+class LLMLocalConfig(_FrozenModel):
     base_url: str = "http://localhost:8000/v1"
     model: str = "mistralai/Mistral-Nemo-Instruct-2407"
 
 
-class LLMApiConfig(BaseModel):
+class LLMApiConfig(_FrozenModel):
     base_url: str = "https://api.mistral.ai/v1"
     model: str = "open-mistral-nemo"
     api_key_env: str = "MISTRAL_API_KEY"
 
 
-class LLMConfig(BaseModel):
+class LLMConfig(_FrozenModel):
     backend: str = "api"
     max_tool_iterations: int = 10
+    enable_cache: bool = False  # response cache; keep off when tools mutate state
     local: LLMLocalConfig = LLMLocalConfig()
     api: LLMApiConfig = LLMApiConfig()
 
 
-class TTSLocalConfig(BaseModel):
+class TTSLocalConfig(_FrozenModel):
     model: str = "fastpitch_hifigan"
     model_path: str = "~/.voxaos/models/nemo-tts"
 
 
-class TTSApiConfig(BaseModel):
+class TTSApiConfig(_FrozenModel):
     base_url: str = "https://integrate.api.nvidia.com/v1"
     api_key_env: str = "NVIDIA_API_KEY"
     voice: str = "English-US.Female-1"
 
 
-class TTSConfig(BaseModel):
+class TTSConfig(_FrozenModel):
     backend: str = "disabled"
     local: TTSLocalConfig = TTSLocalConfig()
     api: TTSApiConfig = TTSApiConfig()
 
 
-class VADConfig(BaseModel):
+class VADConfig(_FrozenModel):
     threshold: float = 0.5
     speech_start_ms: int = 300
     silence_end_ms: int = 500
+    device: str = "cpu"  # "cuda" runs VAD on GPU where ORT supports it
+    # Utterances quieter/shorter than this skip the STT round-trip
+    min_rms: float = 0.005
+    min_utterance_ms: int = 250
 
 
-class ToolsConfig(BaseModel):
+class ToolsConfig(_FrozenModel):
     shell_timeout: int = 30
     output_max_chars: int = 4096
     blocked_commands: list[str] = []
 
 
-class MemoryLearningConfig(BaseModel):
+class MemoryLearningConfig(_FrozenModel):
     enabled: bool = True
+    # Qdrant HNSW tuning for the memory collection
+    hnsw_m: int = 24
+    hnsw_ef_construct: int = 128
+    quantization: bool = True
 
 
-class MemoryCaptureConfig(BaseModel):
+class MemoryCaptureConfig(_FrozenModel):
     enabled: bool = True
     db_path: str = "~/.voxaos/capture.db"
 
 
-class MemoryConfig(BaseModel):
+class MemoryConfig(_FrozenModel):
     enabled: bool = True
     storage_path: str = "~/.voxaos/memory"
     learning: MemoryLearningConfig = MemoryLearningConfig()
     capture: MemoryCaptureConfig = MemoryCaptureConfig()
 
 
-class HAInsightsConfig(BaseModel):
+class HAInsightsConfig(_FrozenModel):
     enabled: bool = True
     schedule: str = "daily"
     time: str = "08:00"
     entities: list[str] = []
 
 
-class HomeAssistantConfig(BaseModel):
+class HomeAssistantConfig(_FrozenModel):
     enabled: bool = False
     url: str = "http://homeassistant.local:8123"
     token_env: str = "HA_TOKEN"
     insights: HAInsightsConfig = HAInsightsConfig()
 
 
-class ContextConfig(BaseModel):
+class ContextConfig(_FrozenModel):
     max_history: int = 20
 
 
-class ModeConfig(BaseModel):
+class ModeConfig(_FrozenModel):
     backend: str = "api"
 
 
-class Config(BaseModel):
+class Config(_FrozenModel):
     mode: ModeConfig = ModeConfig()
     server: ServerConfig = ServerConfig()
     stt: STTConfig = STTConfig()
@@ -120,8 +149,30 @@ class Config(BaseModel):
     context: ContextConfig = ContextConfig()
 
 
+# Built once at import — reuses the same compiled pydantic-core schema
+# for every load instead of rebuilding per call.
+_CONFIG_ADAPTER: TypeAdapter[Config] = TypeAdapter(Config)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_impl(path: str, mtime: float) -> Config:
+    # mtime is only part of the cache key — an edited file reloads
+    if rtoml is not None:
+        data = rtoml.load(Path(path))
+    else:
+        with open(path, "rb") as f:
+            data = tomli.load(f)
+    return _CONFIG_ADAPTER.validate_python(data)
+
+
 def load_config(path: str = "config/default.toml") -> Config:
-    """Load config from TOML file, validate with Pydantic."""
-    with open(path, "rb") as f:
-        data = tomli.load(f)
-    return Config(**data)
+    """Load config from TOML file, validate with Pydantic.
+
+    Results are cached per (path, mtime): a stat costs microseconds,
+    re-parsing and re-validating costs milliseconds.
+    """
+    return _load_config_impl(path, os.path.getmtime(path))
+
+
+# Tests that mutate config files mid-run can force a re-parse
+load_config.cache_clear = _load_config_impl.cache_clear  # type: ignore[attr-defined]
@@ -1,49 +1,113 @@
+import atexit
+import functools
 import os
-import platform
-import subprocess
-from dataclasses import dataclass
+import sys
+import time
+from collections import deque
 
+try:
+    import pynvml  # type: ignore[import-untyped]
+except ImportError:
+    pynvml = None
 
-@dataclass
-class ConversationTurn:
-    role: str  # "user" or "assistant"
-    content: str
+# Lazy NVML init state: None = not attempted, True/False = init result
+_nvml_ready: bool | None = None
+
+
+def _nvml_init() -> bool:
+    """Initialize NVML once; later calls return the cached result."""
+    global _nvml_ready
+    if _nvml_ready is None:
+        if pynvml is None:
+            _nvml_ready = False
+        else:
+            try:
+                pynvml.nvmlInit()
+                atexit.register(pynvml.nvmlShutdown)
+                _nvml_ready = True
+            except pynvml.NVMLError:
+                _nvml_ready = False
+    return _nvml_ready
+
+
+def _gpu_line() -> str:
+    if not _nvml_init():
+        return "- GPU: not available"
+    try:
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        name = pynvml.nvmlDeviceGetName(handle)
+        if isinstance(name, bytes):
+            name = name.decode()
+        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        used_mib = mem.used // (1024 * 1024)
+        total_mib = mem.total // (1024 * 1024)
+        return f"- GPU: {name}, {used_mib}, {total_mib}"
+    except pynvml.NVMLError:
+        return "- GPU: not available"
+
+
+@functools.lru_cache(maxsize=1)
+def _static_env() -> str:
+    """OS/host/user/python lines — constant for the process lifetime.
+
+    One os.uname() syscall instead of the platform module's per-field
+    introspection (platform.release() shells out on some systems).
+    """
+    if hasattr(os, "uname"):
+        uname = os.uname()
+        sysname, release, nodename = uname.sysname, uname.release, uname.nodename
+    else:  # Windows has no uname
+        import platform
+
+        sysname, release, nodename = platform.system(), platform.release(), platform.node()
+    vi = sys.version_info
+    return "\n".join(
+        [
+            f"- OS: {sysname} {release}",
+            f"- Hostname: {nodename}",
+            f"- User: {os.environ.get('USER', 'unknown')}",
+            f"- Python: {vi.major}.{vi.minor}.{vi.micro}",
+        ]
+    )
 
 
 class ContextManager:
+    # GPU memory usage drifts within a session; refresh at most every 30s
+    _GPU_TTL_S = 30.0
+    _gpu_cache: tuple[str, float] = ("", 0.0)
+
     def __init__(self, max_history: int = 20):
         self.max_history = max_history
-        self.history: list[ConversationTurn] = []
+        # user+assistant pairs in OpenAI message format; the deque
+        # evicts the oldest turn in O(1)
+        self.history: deque[dict] = deque(maxlen=max_history * 2)
 
     def add_turn(self, role: str, content: str) -> None:
-        self.history.append(ConversationTurn(role=role, content=content))
-        if len(self.history) > self.max_history * 2:  # user+assistant pairs
-            self.history = self.history[-(self.max_history * 2) :]
+        self.history.append({"role": role, "content": content})
 
     def get_messages(self) -> list[dict]:
-        return [{"role": t.role, "content": t.content} for t in self.history]
+        # Shallow copy so callers can extend without touching history
+        return list(self.history)
 
     def clear(self) -> None:
         self.history.clear()
 
-    @staticmethod
-    def build_env_context() -> str:
-        lines = [
-            f"- OS: {platform.system()} {platform.release()}",
-            f"- Hostname: {platform.node()}",
-            f"- Working directory: {os.getcwd()}",
-            f"- User: {os.environ.get('USER', 'unknown')}",
-            f"- Python: {platform.python_version()}",
-        ]
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name,memory.used,memory.total", "--format=csv,noheader,nounits"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                lines.append(f"- GPU: {result.stdout.strip()}")
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            lines.append("- GPU: not available")
-        return "\n".join(lines)
+    @classmethod
+    def _gpu_line_cached(cls) -> str:
+        value, expiry = cls._gpu_cache
+        now = time.monotonic()
+        if now >= expiry:
+            value = _gpu_line()
+            cls._gpu_cache = (value, now + cls._GPU_TTL_S)
+        return value
+
+    @classmethod
+    def invalidate_env_cache(cls) -> None:
+        """Drop cached env info — for tests and after chdir/env changes."""
+        _static_env.cache_clear()
+        cls._gpu_cache = ("", 0.0)
+
+    @classmethod
+    def build_env_context(cls) -> str:
+        # cwd is the only cheap-but-mutable field; read it fresh each call
+        return f"{_static_env()}\n- Working directory: {os.getcwd()}\n{cls._gpu_line_cached()}"
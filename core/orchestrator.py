@@ -1,11 +1,23 @@
-import json
+import asyncio
+import secrets
 import time
-import uuid
+from collections.abc import AsyncGenerator
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
 from core.config import Config
 from core.context import ContextManager
-from core.types import Response, ToolCall
+from core.types import Response, RiskLevel, StreamChunk, StreamChunkType, ToolCall, ToolResult
 from llm.client import LLMClient
 from llm.prompts import build_system_prompt
 from llm.tools import get_tools
@@ -13,10 +25,18 @@ from memory.capture import CaptureLog
 from memory.learning import LearningMemory
 from memory.types import InteractionRecord
 from skills.loader import load_skills
-from skills.selector import select_skill
+from skills.selector import SkillRegistry, select_skill
 from tools.executor import ToolExecutor
 
 
+async def _timed(coro, key: str, timing: dict[str, float]):
+    """Await coro, recording its wall time under timing[key]."""
+    t0 = time.perf_counter_ns()
+    result = await coro
+    timing[key] = (time.perf_counter_ns() - t0) / 1_000_000
+    return result
+
+
 class Orchestrator:
     def __init__(
         self,
@@ -32,37 +52,112 @@ class Orchestrator:
         self.learning_memory = learning_memory
         self.capture_log = capture_log
         self.context = ContextManager(max_history=config.context.max_history)
-        self.skills = load_skills("skills")
+        self.skills = SkillRegistry(load_skills("skills"))
         self.tools = get_tools(config)
-        self.session_id = str(uuid.uuid4())[:8]
+        self.session_id = secrets.token_hex(4)
+        # Background persistence: (fn, args) pairs drained by a worker
+        # task so DB writes never sit on the user-turn critical path.
+        self._bg_queue: asyncio.Queue = asyncio.Queue()
+        self._bg_task: asyncio.Task | None = None
+
+    def _enqueue_bg(self, fn, *args) -> None:
+        if self._bg_task is None or self._bg_task.done():
+            self._bg_task = asyncio.create_task(self._drain_bg_queue())
+        self._bg_queue.put_nowait((fn, args))
+
+    async def _drain_bg_queue(self) -> None:
+        while True:
+            fn, args = await self._bg_queue.get()
+            try:
+                await asyncio.to_thread(fn, *args)
+            except Exception:
+                pass  # Don't let memory failures break the pipeline
+            finally:
+                self._bg_queue.task_done()
+
+    async def close(self) -> None:
+        """Flush pending background writes and stop the workers."""
+        if self._bg_task is not None:
+            await self._bg_queue.join()
+            self._bg_task.cancel()
+            self._bg_task = None
+        if self.learning_memory:
+            await self.learning_memory.shutdown()
+        if self.capture_log:
+            # Sessions shorter than the batch size would otherwise lose
+            # every buffered row
+            await asyncio.to_thread(self.capture_log.close)
+
+    async def _execute_tool_calls(self, tool_calls: list[ToolCall]) -> list[ToolResult]:
+        """Execute a batch of tool calls, in the order they were issued.
+
+        Independent calls run concurrently; DANGEROUS calls stay
+        serialized so confirmation prompts arrive one at a time.
+        """
+        results: list[ToolResult | None] = [None] * len(tool_calls)
+        parallel: list[tuple[int, ToolCall]] = []
+        serial: list[tuple[int, ToolCall]] = []
+        for i, tc in enumerate(tool_calls):
+            if self.executor.classify_risk(tc) == RiskLevel.DANGEROUS:
+                serial.append((i, tc))
+            else:
+                parallel.append((i, tc))
+
+        if parallel:
+            gathered = await asyncio.gather(*(self.executor.execute(tc) for _, tc in parallel))
+            for (i, _), result in zip(parallel, gathered, strict=True):
+                results[i] = result
+        for i, tc in serial:
+            results[i] = await self.executor.execute(tc)
+
+        return results  # type: ignore[return-value]
+
+    async def _search_memories(self, user_input: str) -> list[str]:
+        if not self.learning_memory:
+            return []
+        return await asyncio.to_thread(self.learning_memory.search, user_input)
 
     async def process(self, user_input: str) -> Response:
         """Process user input through the full pipeline.
 
         Returns a Response with text, tool calls made, and latency info.
+        Collects the stream() generator — callers that can act on
+        partial output should consume stream() directly.
+        """
+        response = Response(text="")
+        async for chunk in self.stream(user_input):
+            if chunk.type == StreamChunkType.RESPONSE:
+                response = chunk.content
+        return response
+
+    async def stream(self, user_input: str) -> AsyncGenerator[StreamChunk, None]:
+        """Process user input, yielding chunks as they become available.
+
+        Yields TEXT chunks at first-token latency, TOOL_START /
+        TOOL_RESULT chunks around tool execution, and a final RESPONSE
+        chunk carrying the collected Response.
         """
         timing: dict[str, float] = {}
         tool_calls_made: list[ToolCall] = []
         selected_skill = None
 
-        # --- Step 1: Memory recall ---
-        t0 = time.time()
+        # --- Steps 1-3: Memory recall, skill selection, env context ---
+        # Independent of each other, so run them concurrently; the
+        # blocking calls go through worker threads.
+        t0 = time.perf_counter_ns()
+        memories, selected_skill, env_context = await asyncio.gather(
+            _timed(self._search_memories(user_input), "memory_search", timing),
+            _timed(select_skill(user_input, self.skills), "skill_select", timing),
+            asyncio.to_thread(ContextManager.build_env_context),
+        )
+        timing["parallel_prep"] = (time.perf_counter_ns() - t0) / 1_000_000
+
         memory_context = ""
-        if self.learning_memory:
-            memories = self.learning_memory.search(user_input)
-            if memories:
-                memory_context = "Relevant memories from past interactions:\n"
-                memory_context += "\n".join(f"- {m}" for m in memories)
-        timing["memory_search"] = (time.time() - t0) * 1000
-
-        # --- Step 2: Skill selection ---
-        t0 = time.time()
-        selected_skill = await select_skill(user_input, self.skills, self.llm)
+        if memories:
+            memory_context = "Relevant memories from past interactions:\n"
+            memory_context += "\n".join(f"- {m}" for m in memories)
         skill_body = selected_skill.body if selected_skill else ""
-        timing["skill_select"] = (time.time() - t0) * 1000
 
-        # --- Step 3: Build system prompt ---
-        env_context = ContextManager.build_env_context()
         system_prompt = build_system_prompt(
             env_context=env_context,
             memory_context=memory_context,
@@ -75,20 +170,33 @@ class Orchestrator:
         messages.append({"role": "user", "content": user_input})
 
         # --- Step 5: LLM call + tool loop ---
-        t0 = time.time()
+        t0 = time.perf_counter_ns()
         max_iterations = self.config.llm.max_tool_iterations
-        result: dict = {}
+        # Hoisted: the same messages list grows in place across
+        # iterations and the tools arg never changes mid-turn.
+        tools_arg = self.tools or None
+        text_parts: list[str] = []
 
         for _ in range(max_iterations):
-            result = await self.llm.chat(messages, tools=self.tools)
+            text_parts = []
+            tool_calls: list[ToolCall] = []
+
+            async for chunk in self.llm.chat_stream(messages, tools=tools_arg):
+                if chunk.type == StreamChunkType.TEXT:
+                    text_parts.append(chunk.content)
+                    yield chunk
+                elif chunk.type == StreamChunkType.TOOL_START:
+                    tool_calls.append(chunk.content)
+                    yield chunk
 
-            if not result["tool_calls"]:
+            if not tool_calls:
                 break
 
-            # Execute each tool call
-            for tc in result["tool_calls"]:
+            # Execute the batch, then append messages in issue order
+            tool_results = await self._execute_tool_calls(tool_calls)
+            for tc, tool_result in zip(tool_calls, tool_results, strict=True):
                 tool_calls_made.append(tc)
-                tool_result = await self.executor.execute(tc)
+                yield StreamChunk(type=StreamChunkType.TOOL_RESULT, content=tool_result.content)
 
                 messages.append(
                     {
@@ -100,7 +208,7 @@ class Orchestrator:
                                 "type": "function",
                                 "function": {
                                     "name": tc.name,
-                                    "arguments": json.dumps(tc.args),
+                                    "arguments": _dumps(tc.args),
                                 },
                             }
                         ],
@@ -114,40 +222,39 @@ class Orchestrator:
                     }
                 )
 
-        timing["llm_total"] = (time.time() - t0) * 1000
+        timing["llm_total"] = (time.perf_counter_ns() - t0) / 1_000_000
 
-        final_text = result.get("content") or ""
+        final_text = "".join(text_parts)
 
         # --- Step 6: Update context ---
         self.context.add_turn("user", user_input)
         self.context.add_turn("assistant", final_text)
 
-        # --- Step 7: Save to memory ---
+        # --- Step 7: Save to memory (fire-and-forget) ---
         if self.learning_memory and final_text:
-            try:
-                self.learning_memory.add(user_input, final_text)
-            except Exception:
-                pass  # Don't let memory failures break the pipeline
+            # add() just queues — mem0 extraction runs in its own worker
+            await self.learning_memory.add(user_input, final_text)
 
         if self.capture_log:
-            try:
-                self.capture_log.log(
-                    InteractionRecord(
-                        session_id=self.session_id,
-                        timestamp=datetime.now(),
-                        user_transcript=user_input,
-                        llm_messages=messages,
-                        tool_calls=[{"name": tc.name, "args": tc.args} for tc in tool_calls_made],
-                        assistant_response=final_text,
-                        skill_used=selected_skill.name if selected_skill else None,
-                        latency_ms=timing,
-                    )
-                )
-            except Exception:
-                pass
+            self._enqueue_bg(
+                self.capture_log.log,
+                InteractionRecord(
+                    session_id=self.session_id,
+                    timestamp=datetime.now(),
+                    user_transcript=user_input,
+                    llm_messages=messages,
+                    tool_calls=tool_calls_made,
+                    assistant_response=final_text,
+                    skill_used=selected_skill.name if selected_skill else None,
+                    latency_ms=timing,
+                ),
+            )
 
-        return Response(
-            text=final_text,
-            tool_calls_made=tool_calls_made,
-            latency_ms=timing,
+        yield StreamChunk(
+            type=StreamChunkType.RESPONSE,
+            content=Response(
+                text=final_text,
+                tool_calls_made=tool_calls_made,
+                latency_ms=timing,
+            ),
         )
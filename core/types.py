@@ -24,29 +24,30 @@ class StreamChunkType(StrEnum):
     TEXT = "text"
     AUDIO = "audio"
     STATE = "state"
+    RESPONSE = "response"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     id: str
     name: str
     args: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     tool_call_id: str
     content: str
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     type: StreamChunkType
     content: Any  # str for text types, bytes for audio
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     text: str
     audio_bytes: bytes | None = None
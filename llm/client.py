@@ -1,29 +1,64 @@
-import json
+import copy
+import hashlib
 import os
+from collections.abc import AsyncGenerator
+from collections import OrderedDict
 
+try:
+    # ~2x faster on small dicts than stdlib json
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    import json
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    from json import loads as json_loads
+
+import httpx
 from openai import AsyncOpenAI
 
 from core.config import LLMConfig
-from core.types import ToolCall
+from core.types import StreamChunk, StreamChunkType, ToolCall
 
 
 class LLMClient:
+    # LRU response cache bound — small enough to stay RAM-friendly
+    _CACHE_MAX = 256
+
     def __init__(self, config: LLMConfig):
         self.config = config
+        # chat() entries are result dicts; chat_stream() entries are
+        # recorded chunk lists (keys are tagged so they never collide)
+        self._cache: OrderedDict[str, dict | list[StreamChunk]] = OrderedDict()
+        # Shared pool: keep-alive avoids TCP/TLS handshakes per call and
+        # HTTP/2 multiplexes the concurrent tool-loop sub-requests.
+        http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
         if config.backend == "api":
             api_key = os.environ.get(config.api.api_key_env, "")
             self.client = AsyncOpenAI(
                 base_url=config.api.base_url,
                 api_key=api_key,
+                http_client=http_client,
             )
             self.model = config.api.model
         else:
             self.client = AsyncOpenAI(
                 base_url=config.local.base_url,
                 api_key="not-needed",
+                http_client=http_client,
             )
             self.model = config.local.model
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self.client.close()
+
     async def chat(self, messages: list[dict], tools: list[dict] | None = None) -> dict:
         """Send messages to LLM, optionally with tool definitions.
 
@@ -31,7 +66,20 @@ class LLMClient:
           - content: str | None (text response)
           - tool_calls: list[ToolCall] | None (if LLM wants to call tools)
           - raw: the full API response object
+
+        When llm.enable_cache is set, identical (model, messages,
+        tools) requests are answered from an in-memory LRU — repeat
+        voice prompts ("what time is it") skip the network entirely.
         """
+        cache_key = None
+        if self.config.enable_cache:
+            fingerprint = json_dumps([self.model, messages, tools])
+            cache_key = hashlib.blake2b(fingerprint, digest_size=16).hexdigest()
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+
         kwargs: dict = {
             "model": self.model,
             "messages": messages,
@@ -54,13 +102,97 @@ class LLMClient:
                 ToolCall(
                     id=tc.id,
                     name=tc.function.name,
-                    args=json.loads(tc.function.arguments),
+                    args=json_loads(tc.function.arguments),
                 )
                 for tc in choice.message.tool_calls
             ]
 
+        if cache_key is not None:
+            self._cache[cache_key] = copy.deepcopy(result)
+            if len(self._cache) > self._CACHE_MAX:
+                self._cache.popitem(last=False)
+
         return result
 
+    async def chat_stream(
+        self, messages: list[dict], tools: list[dict] | None = None
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Stream a chat completion as StreamChunks.
+
+        Yields TEXT chunks as content deltas arrive, so callers can
+        start acting on the first token instead of the last. Tool-call
+        deltas are accumulated internally; one TOOL_START chunk per
+        assembled ToolCall is yielded once the stream ends.
+
+        When llm.enable_cache is set, identical (model, messages,
+        tools) requests replay the recorded chunks from the in-memory
+        LRU — repeat voice prompts skip the network entirely.
+        """
+        cache_key = None
+        recorded: list[StreamChunk] | None = None
+        if self.config.enable_cache:
+            # "stream" tag keeps these keys disjoint from chat()'s —
+            # same fingerprint, different value shape
+            fingerprint = json_dumps(["stream", self.model, messages, tools])
+            cache_key = hashlib.blake2b(fingerprint, digest_size=16).hexdigest()
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                for chunk in cached:
+                    yield copy.deepcopy(chunk)
+                return
+            recorded = []
+
+        kwargs: dict = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+        }
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = "auto"
+
+        stream = await self.client.chat.completions.create(**kwargs)
+
+        # Tool calls arrive as fragments keyed by index; stitch them up
+        pending_tool_calls: dict[int, dict] = {}
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                out = StreamChunk(type=StreamChunkType.TEXT, content=delta.content)
+                if recorded is not None:
+                    recorded.append(out)
+                yield out
+            for tc in delta.tool_calls or []:
+                entry = pending_tool_calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+                if tc.id:
+                    entry["id"] = tc.id
+                if tc.function and tc.function.name:
+                    entry["name"] = tc.function.name
+                if tc.function and tc.function.arguments:
+                    entry["arguments"] += tc.function.arguments
+
+        for _, entry in sorted(pending_tool_calls.items()):
+            out = StreamChunk(
+                type=StreamChunkType.TOOL_START,
+                content=ToolCall(
+                    id=entry["id"],
+                    name=entry["name"],
+                    args=json_loads(entry["arguments"] or "{}"),
+                ),
+            )
+            if recorded is not None:
+                recorded.append(out)
+            yield out
+
+        if cache_key is not None:
+            # Store copies — callers may mutate the chunks they received
+            self._cache[cache_key] = copy.deepcopy(recorded)
+            if len(self._cache) > self._CACHE_MAX:
+                self._cache.popitem(last=False)
+
     async def chat_simple(self, messages: list[dict]) -> str:
         """Simple chat without tools — returns just the text content."""
         result = await self.chat(messages)
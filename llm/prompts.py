@@ -1,5 +1,6 @@
-import os
-import platform
+import functools
+
+from core.context import ContextManager
 
 SYSTEM_PROMPT = """You are VoxaOS, a voice-controlled operating system running on an NVIDIA L40S GPU.
 You have direct access to the host Linux system through your tools.
@@ -18,32 +19,31 @@ Rules:
 - If a command fails, explain the error briefly and suggest a fix."""
 
 
+@functools.lru_cache(maxsize=64)
 def build_system_prompt(
     env_context: str = "",
     memory_context: str = "",
     skill_body: str = "",
 ) -> str:
-    """Build the full system prompt with dynamic sections."""
-    parts = [SYSTEM_PROMPT]
+    """Build the full system prompt with dynamic sections.
+
+    Cached: env_context barely changes turn-to-turn and skill bodies
+    come from a small fixed set, so repeat turns reuse the assembled
+    string instead of re-concatenating the ~1KB preamble.
+    """
+    prompt = SYSTEM_PROMPT
 
     if env_context:
-        parts.append(f"\n\n## Current Environment\n{env_context}")
+        prompt += f"\n\n\n## Current Environment\n{env_context}"
 
     if memory_context:
-        parts.append(f"\n\n## Relevant Memories\n{memory_context}")
+        prompt += f"\n\n\n## Relevant Memories\n{memory_context}"
 
     if skill_body:
-        parts.append(f"\n\n## Active Skill Instructions\n{skill_body}")
+        prompt += f"\n\n\n## Active Skill Instructions\n{skill_body}"
 
-    return "\n".join(parts)
+    return prompt
 
 
-def build_env_context() -> str:
-    """Gather current environment info."""
-    return (
-        f"- OS: {platform.system()} {platform.release()}\n"
-        f"- Hostname: {platform.node()}\n"
-        f"- Working directory: {os.getcwd()}\n"
-        f"- User: {os.environ.get('USER', 'unknown')}\n"
-        f"- Python: {platform.python_version()}"
-    )
+# Alias — the canonical env-context builder lives in core/context.py
+build_env_context = ContextManager.build_env_context
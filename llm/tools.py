@@ -320,9 +320,14 @@ HA_TOOLS: list[dict] = [
 ]
 
 
+# Prebuilt once — the schemas are immutable, so both variants can be
+# shared by every Orchestrator instead of copied per call.
+_ALL_TOOLS: list[dict] = CORE_TOOLS + HA_TOOLS
+
+
 def get_tools(config: Config) -> list[dict]:
-    """Return all tool definitions, gating HA tools on config."""
-    tools = list(CORE_TOOLS)
-    if config.home_assistant.enabled:
-        tools.extend(HA_TOOLS)
-    return tools
+    """Return all tool definitions, gating HA tools on config.
+
+    Returns a shared prebuilt list — callers must not mutate it.
+    """
+    return _ALL_TOOLS if config.home_assistant.enabled else CORE_TOOLS
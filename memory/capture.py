@@ -1,17 +1,66 @@
-import json
+import asyncio
 import os
 import sqlite3
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 from memory.types import InteractionRecord
 
+_INSERT_SQL = """INSERT INTO interactions
+   (session_id, timestamp, user_transcript, llm_messages,
+    tool_calls, assistant_response, skill_used, latency_ms)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Columns stored as JSON text; decoded lazily on access
+_JSON_COLS = frozenset({"llm_messages", "tool_calls", "latency_ms"})
+
+
+class Row(dict):
+    """Captured interaction row that decodes its JSON columns lazily.
+
+    Most inspection touches one or two fields, so the JSON text in
+    llm_messages/tool_calls/latency_ms stays a string until first
+    access, then the decoded value is memoized in place.
+    """
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if key in _JSON_COLS and isinstance(value, str):
+            value = _loads(value)
+            self[key] = value
+        return value
+
 
 class CaptureLog:
+    # Rows buffered before a flush — one fsync per batch, not per row
+    _FLUSH_EVERY = 16
+
     def __init__(self, db_path: str = "~/.voxaos/capture.db"):
         db_path = os.path.expanduser(db_path)
         parent = os.path.dirname(db_path)
         if parent:
             os.makedirs(parent, exist_ok=True)
-        self.conn = sqlite3.connect(db_path)
+        # Writes come in from worker threads (background persistence).
+        # isolation_level=None keeps sqlite3 out of implicit-transaction
+        # bookkeeping — batches open their own BEGIN IMMEDIATE below.
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        # WAL lets get_recent read while a flush writes; synchronous=
+        # NORMAL skips the per-commit fsync (WAL keeps this durable
+        # against app crashes, trading a little durability on OS crash).
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+        self._pending: list[tuple] = []
+        # Single writer thread: alog() keeps sqlite fsyncs off the event
+        # loop while still serializing all writes on one connection.
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture-log")
         self._init_db()
 
     def _init_db(self) -> None:
@@ -28,31 +77,69 @@ class CaptureLog:
                 latency_ms TEXT
             )
         """)
-        self.conn.commit()
+        # get_recent's ORDER BY id DESC walks the rowid in reverse, so
+        # it needs no index; this covers per-session history queries.
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_interactions_session_id
+            ON interactions(session_id, id DESC)
+        """)
 
-    def log(self, record: InteractionRecord) -> None:
-        self.conn.execute(
-            """INSERT INTO interactions
-               (session_id, timestamp, user_transcript, llm_messages,
-                tool_calls, assistant_response, skill_used, latency_ms)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                record.session_id,
-                record.timestamp.isoformat(),
-                record.user_transcript,
-                json.dumps(record.llm_messages),
-                json.dumps(record.tool_calls),
-                record.assistant_response,
-                record.skill_used,
-                json.dumps(record.latency_ms),
-            ),
+    @staticmethod
+    def _row(record: InteractionRecord) -> tuple:
+        return (
+            record.session_id,
+            record.timestamp.isoformat(),
+            record.user_transcript,
+            record.json_llm_messages,
+            record.json_tool_calls,
+            record.assistant_response,
+            record.skill_used,
+            record.json_latency_ms,
         )
-        self.conn.commit()
 
-    def get_recent(self, limit: int = 10) -> list[dict]:
+    def log(self, record: InteractionRecord) -> None:
+        """Buffer a record; flushed in batches to amortize the fsync."""
+        self._pending.append(self._row(record))
+        if len(self._pending) >= self._FLUSH_EVERY:
+            self.flush()
+
+    async def alog(self, record: InteractionRecord) -> None:
+        """log() for async callers — runs the write on the writer thread."""
+        await asyncio.get_running_loop().run_in_executor(self._writer, self.log, record)
+
+    def log_many(self, records: list[InteractionRecord]) -> None:
+        """Insert a batch of records in a single transaction."""
+        self._insert_batch([self._row(r) for r in records])
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        self._insert_batch(self._pending)
+        self._pending.clear()
+
+    def _insert_batch(self, rows: list[tuple]) -> None:
+        # IMMEDIATE grabs the write lock up front so the batch can't
+        # fail halfway on a lock upgrade.
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.executemany(_INSERT_SQL, rows)
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def iter_recent(self, limit: int = 10) -> Iterator[Row]:
+        """Yield recent rows newest-first; callers can stop early."""
+        self.flush()  # read-your-writes for buffered rows
         cursor = self.conn.execute("SELECT * FROM interactions ORDER BY id DESC LIMIT ?", (limit,))
         columns = [d[0] for d in cursor.description]
-        return [dict(zip(columns, row, strict=False)) for row in cursor.fetchall()]
+        for row in cursor:
+            yield Row(zip(columns, row, strict=False))
+
+    def get_recent(self, limit: int = 10) -> list[dict]:
+        return list(self.iter_recent(limit))
 
     def close(self) -> None:
+        self._writer.shutdown(wait=True)
+        self.flush()
         self.conn.close()
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 
 from mem0 import Memory  # type: ignore[import-untyped]
 
@@ -6,6 +8,12 @@ from core.config import LLMConfig, MemoryConfig
 
 
 class LearningMemory:
+    # Repeat searches within a turn or two hit Qdrant for the same
+    # memories — short TTL keeps hits fresh enough while skipping the
+    # vector round-trip.
+    _SEARCH_TTL_S = 30.0
+    _SEARCH_CACHE_MAX = 128
+
     def __init__(self, memory_config: MemoryConfig, llm_config: LLMConfig):
         # Determine LLM endpoint for mem0's extraction
         if llm_config.backend == "api":
@@ -40,16 +48,90 @@ class LearningMemory:
             }
         )
 
-    def add(self, user_msg: str, assistant_msg: str, user_id: str = "default") -> None:
+        self._tune_collection(memory_config)
+
+        # add() only queues — extraction (a full LLM call inside mem0)
+        # happens in a worker task so turns never wait on it.
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self._search_cache: dict[tuple[str, str, int], tuple[float, list[str]]] = {}
+
+    def _tune_collection(self, memory_config: MemoryConfig) -> None:
+        """Apply HNSW/quantization settings to the Qdrant collection.
+
+        mem0 creates the collection with library defaults; retuning it
+        here (denser graph, int8-quantized vectors) trades a little
+        index-build time for markedly faster per-turn searches. mem0's
+        search API doesn't accept per-request params, so tuning is
+        collection-level only.
+        """
+        client = getattr(getattr(self.memory, "vector_store", None), "client", None)
+        if client is None:
+            return
+        try:
+            from qdrant_client import models  # type: ignore[import-untyped]
+
+            learning = memory_config.learning
+            quantization = None
+            if learning.quantization:
+                quantization = models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(
+                        type=models.ScalarType.INT8,
+                        always_ram=True,
+                    )
+                )
+            client.update_collection(
+                collection_name="voxaos",
+                hnsw_config=models.HnswConfigDiff(
+                    m=learning.hnsw_m,
+                    ef_construct=learning.hnsw_ef_construct,
+                ),
+                quantization_config=quantization,
+            )
+        except Exception:
+            pass  # Tuning is best-effort — defaults still work
+
+    async def add(self, user_msg: str, assistant_msg: str, user_id: str = "default") -> None:
+        """Queue a turn for background extraction; returns immediately."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
         messages = [
             {"role": "user", "content": user_msg},
             {"role": "assistant", "content": assistant_msg},
         ]
-        self.memory.add(messages, user_id=user_id)
+        self._queue.put_nowait((messages, user_id))
+
+    async def _drain(self) -> None:
+        while True:
+            messages, user_id = await self._queue.get()
+            try:
+                await asyncio.to_thread(self.memory.add, messages, user_id=user_id)
+            except Exception:
+                pass  # Extraction failures shouldn't take down the worker
+            finally:
+                self._queue.task_done()
+
+    async def shutdown(self) -> None:
+        """Wait for queued extractions to finish and stop the worker."""
+        if self._worker is not None:
+            await self._queue.join()
+            self._worker.cancel()
+            self._worker = None
 
     def search(self, query: str, user_id: str = "default", limit: int = 5) -> list[str]:
+        key = (user_id, query.strip().lower(), limit)
+        now = time.monotonic()
+        hit = self._search_cache.get(key)
+        if hit is not None and now - hit[0] < self._SEARCH_TTL_S:
+            return hit[1]
+
         results = self.memory.search(query, user_id=user_id, limit=limit)
-        return [r["memory"] for r in results.get("results", [])]
+        memories = [r["memory"] for r in results.get("results", [])]
+
+        if len(self._search_cache) >= self._SEARCH_CACHE_MAX:
+            self._search_cache.pop(next(iter(self._search_cache)))
+        self._search_cache[key] = (now, memories)
+        return memories
 
     def get_all(self, user_id: str = "default") -> list[str]:
         results = self.memory.get_all(user_id=user_id)
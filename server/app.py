@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -11,7 +12,7 @@ from core.orchestrator import Orchestrator
 from llm.client import LLMClient
 from memory import create_memory
 from server.audio_handler import AudioHandler
-from tools import register_all_tools
+from tools import _http, register_all_tools
 from tools.executor import ToolExecutor
 from voice.pipeline import VoicePipeline
 from voice.stt import create_stt
@@ -32,7 +33,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Init components
     llm_client = LLMClient(config.llm)
     executor = ToolExecutor(config.tools)
-    register_all_tools(executor, config)
+    ha_tools = register_all_tools(executor, config)
     learning, capture = create_memory(config)
 
     orchestrator = Orchestrator(
@@ -49,13 +50,33 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         threshold=config.vad.threshold,
         speech_start_ms=config.vad.speech_start_ms,
         silence_end_ms=config.vad.silence_end_ms,
+        device=config.vad.device,
     )
 
-    pipeline = VoicePipeline(orchestrator=orchestrator, stt=stt, tts=tts, vad=vad)
+    pipeline = VoicePipeline(
+        orchestrator=orchestrator,
+        stt=stt,
+        tts=tts,
+        vad=vad,
+        min_rms=config.vad.min_rms,
+        min_utterance_ms=config.vad.min_utterance_ms,
+    )
+
+    # Warm the STT/TTS connections in the background so the first turn
+    # doesn't pay DNS + TLS on the critical path
+    warmup = asyncio.gather(stt.warmup(), tts.warmup())
 
     yield
 
     # Cleanup
+    warmup.cancel()
+    await orchestrator.close()
+    await llm_client.aclose()
+    await stt.aclose()
+    await tts.aclose()
+    if ha_tools:
+        await ha_tools.aclose()
+    await _http.aclose()
     pipeline = None
     orchestrator = None
 
@@ -1,21 +1,59 @@
+import asyncio
 import json
 from typing import Any
 
-import numpy as np
 from fastapi import WebSocket
 
 from core.types import PipelineState, StreamChunk, StreamChunkType
 from voice.pipeline import VoicePipeline
 
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 
 class AudioHandler:
     """WebSocket protocol handler for bidirectional audio + control messages."""
 
+    # Samples per outgoing audio frame (40ms at 16kHz int16)
+    _AUDIO_FRAME = 640
+
+    # State frames are tiny and recur constantly — encode each once at
+    # class-definition time so the per-event path is one dict lookup on
+    # an interned frame (kept as str so the batch writer can splice it)
+    _STATE_FRAMES = {
+        state: _json_dumps({"type": "state", "pipeline": state.value}).decode() for state in PipelineState
+    }
+
+    # Stream chunks fire at token rate; only the text varies, so the
+    # envelope is pre-encoded and just the payload is JSON-escaped
+    _THINKING_PREFIX = b'{"type":"thinking","text":'
+    _RESPONSE_PREFIX = b'{"type":"response","tools_used":[],"text":'
+    _TRANSCRIPT_PREFIX = b'{"type":"transcript","partial":false,"text":'
+
     def __init__(self, ws: WebSocket, pipeline: VoicePipeline):
         self.ws = ws
         self.pipeline = pipeline
-        self._ptt_buffer = bytearray()
+        # Outgoing JSON frames funnel through a queue so a burst
+        # (state + transcript + tokens) coalesces into one batch frame;
+        # binary audio keeps its own direct path. The writer task only
+        # runs inside run() — outside it, frames send immediately.
+        self._send_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._writer: asyncio.Task | None = None
+        # Chunk list, joined once on stop — no bytearray realloc churn
+        # during long holds, and join pre-sizes the final buffer
+        self._ptt_buffer: list[bytes] = []
         self._ptt_active = False
+        self._control_handlers = {
+            "push_to_talk": self._handle_ptt,
+            "text_input": self._handle_text_input,
+            "confirm": self._handle_confirm,
+        }
         self._setup_callbacks()
 
     def _setup_callbacks(self) -> None:
@@ -25,100 +63,137 @@ class AudioHandler:
         self.pipeline.on_transcript = self._on_transcript
         self.pipeline.on_stream_chunk = self._on_stream_chunk
 
+    async def _emit(self, frame: str) -> None:
+        """Queue a pre-serialized JSON frame (or send now if no writer)."""
+        if self._writer is None:
+            await self.ws.send_text(frame)
+        else:
+            self._send_queue.put_nowait(frame)
+
+    async def _drain_sends(self) -> None:
+        while True:
+            frames = [await self._send_queue.get()]
+            while True:
+                try:
+                    frames.append(self._send_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if len(frames) == 1:
+                await self.ws.send_text(frames[0])
+            else:
+                # Frames are already JSON — splice, don't re-serialize
+                await self.ws.send_text('{"type":"batch","messages":[' + ",".join(frames) + "]}")
+
+    async def _send(self, obj: dict) -> None:
+        """send_json replacement: orjson-encode once, send as text."""
+        await self._emit(_json_dumps(obj).decode())
+
     async def _on_state_change(self, state: PipelineState) -> None:
-        await self.ws.send_json({"type": "state", "pipeline": state.value})
+        await self._emit(self._STATE_FRAMES[state])
 
     async def _on_audio_out(self, audio_bytes: bytes) -> None:
         await self.ws.send_bytes(audio_bytes)
 
     async def _on_transcript(self, text: str, partial: bool) -> None:
-        await self.ws.send_json({"type": "transcript", "text": text, "partial": partial})
+        await self._send({"type": "transcript", "text": text, "partial": partial})
 
     async def _on_stream_chunk(self, chunk: StreamChunk) -> None:
         if chunk.type == StreamChunkType.THINKING:
-            await self.ws.send_json({"type": "thinking", "text": chunk.content})
+            prefix = self._THINKING_PREFIX
         elif chunk.type == StreamChunkType.TEXT:
-            await self.ws.send_json({
-                "type": "response",
-                "text": chunk.content,
-                "tools_used": [],
-            })
+            prefix = self._RESPONSE_PREFIX
         elif chunk.type == StreamChunkType.TRANSCRIPT:
-            await self.ws.send_json({
-                "type": "transcript",
-                "text": chunk.content,
-                "partial": False,
-            })
+            prefix = self._TRANSCRIPT_PREFIX
+        else:
+            return
+        await self._emit((prefix + _json_dumps(chunk.content) + b"}").decode())
 
     async def run(self) -> None:
         """Main loop — receive messages from WebSocket."""
-        while True:
-            message = await self.ws.receive()
-
-            if message["type"] == "websocket.receive":
-                if "bytes" in message and message["bytes"]:
-                    # Binary = audio data
-                    if self._ptt_active:
-                        self._ptt_buffer.extend(message["bytes"])
-                    else:
-                        await self.pipeline.feed_audio(message["bytes"])
-
-                elif "text" in message and message["text"]:
-                    # JSON = control message
-                    data: dict[str, Any] = json.loads(message["text"])
-                    await self._handle_control(data)
-
-            elif message["type"] == "websocket.disconnect":
-                break
+        # Hoisted out of the per-frame loop — audio arrives at ~33Hz
+        receive = self.ws.receive
+        feed_audio = self.pipeline.feed_audio
+
+        self._writer = asyncio.create_task(self._drain_sends())
+        try:
+            while True:
+                message = await receive()
+                msg_type = message["type"]
+
+                if msg_type == "websocket.receive":
+                    payload = message.get("bytes")
+                    if payload:
+                        # Binary = audio data
+                        if self._ptt_active:
+                            self._ptt_buffer.append(payload)
+                        else:
+                            await feed_audio(payload)
+                    elif message.get("text"):
+                        # JSON = control message
+                        await self._handle_control(_json_loads(message["text"]))
+
+                elif msg_type == "websocket.disconnect":
+                    break
+        finally:
+            self._writer.cancel()
+            self._writer = None
 
     async def _handle_control(self, data: dict[str, Any]) -> None:
-        msg_type = data.get("type")
-
-        if msg_type == "push_to_talk":
-            if data["state"] == "start":
-                self._ptt_active = True
+        handler = self._control_handlers.get(data.get("type"))
+        if handler:
+            await handler(data)
+
+    async def _handle_ptt(self, data: dict[str, Any]) -> None:
+        if data["state"] == "start":
+            self._ptt_active = True
+            self._ptt_buffer.clear()
+        elif data["state"] == "stop":
+            self._ptt_active = False
+            if self._ptt_buffer:
+                await self.pipeline.process_push_to_talk(b"".join(self._ptt_buffer))
                 self._ptt_buffer.clear()
-            elif data["state"] == "stop":
-                self._ptt_active = False
-                if self._ptt_buffer:
-                    await self.pipeline.process_push_to_talk(bytes(self._ptt_buffer))
-                    self._ptt_buffer.clear()
-
-        elif msg_type == "text_input":
-            # Direct text input (bypass voice) — useful for testing
-            text = data.get("text", "")
-            if text and self.pipeline.orchestrator:
-                try:
-                    response = await self.pipeline.orchestrator.process(text)
-                except Exception as e:
-                    await self.ws.send_json({
-                        "type": "response",
-                        "text": f"I'm having trouble connecting to my brain. Try again in a moment. ({e})",
-                        "tools_used": [],
-                    })
-                    return
-
-                await self.ws.send_json({
-                    "type": "response",
-                    "text": response.text,
-                    "tools_used": [tc.name for tc in response.tool_calls_made],
-                })
-
-                # Send latency info
-                if response.latency_ms:
-                    latency_str = " | ".join(f"{k}: {v:.0f}ms" for k, v in response.latency_ms.items())
-                    await self.ws.send_json({"type": "thinking", "text": latency_str})
-
-                # Synthesize and send audio
-                if response.text:
-                    try:
-                        audio = await self.pipeline.tts.synthesize(response.text)
-                        audio_int16 = (audio * 32768).astype(np.int16)
-                        await self.ws.send_bytes(audio_int16.tobytes())
-                    except Exception:
-                        pass  # TTS failure — text response already sent
-
-        elif msg_type == "confirm":
-            # Handle confirmation for dangerous operations
-            # TODO: wire to executor's confirmation callback
-            pass
+
+    async def _handle_text_input(self, data: dict[str, Any]) -> None:
+        # Direct text input (bypass voice) — useful for testing
+        text = data.get("text", "")
+        if not text or not self.pipeline.orchestrator:
+            return
+
+        try:
+            response = await self.pipeline.orchestrator.process(text)
+        except Exception as e:
+            await self._send({
+                "type": "response",
+                "text": f"I'm having trouble connecting to my brain. Try again in a moment. ({e})",
+                "tools_used": [],
+            })
+            return
+
+        await self._send({
+            "type": "response",
+            "text": response.text,
+            "tools_used": [tc.name for tc in response.tool_calls_made],
+        })
+
+        # Send latency info
+        if response.latency_ms:
+            latency_str = " | ".join(f"{k}: {v:.0f}ms" for k, v in response.latency_ms.items())
+            await self._send({"type": "thinking", "text": latency_str})
+
+        # Synthesize and stream audio in small frames so the
+        # client can start playback before the whole utterance
+        # arrives — TTS already returns int16 PCM bytes
+        if response.text:
+            try:
+                pcm = await self.pipeline.tts.synthesize(response.text)
+                view = memoryview(pcm)
+                frame = self._AUDIO_FRAME * 2  # int16 → 2 bytes/sample
+                for start in range(0, len(view), frame):
+                    await self.ws.send_bytes(bytes(view[start : start + frame]))
+            except Exception:
+                pass  # TTS failure — text response already sent
+
+    async def _handle_confirm(self, data: dict[str, Any]) -> None:
+        # Handle confirmation for dangerous operations
+        # TODO: wire to executor's confirmation callback
+        pass
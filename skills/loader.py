@@ -1,8 +1,7 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
-
 
 @dataclass
 class Skill:
@@ -12,17 +11,35 @@ class Skill:
     file_path: Path
 
 
-def load_skills(skills_dir: str | Path = "skills") -> list[Skill]:
-    """Glob all .md files in skills_dir, parse YAML frontmatter, return Skill objects."""
-    skills_dir = Path(skills_dir)
+def _parse_frontmatter(raw: str) -> dict[str, str]:
+    """Parse the tiny `key: value` frontmatter without PyYAML.
+
+    Skill frontmatter only ever holds string scalars (name, description),
+    so a line parser covers it — indented lines are folded continuations
+    of the previous value, matching YAML's plain-scalar folding.
+    """
+    fm: dict[str, str] = {}
+    key = ""
+    for line in raw.strip().splitlines():
+        if key and line[:1].isspace():
+            fm[key] += " " + line.strip()
+            continue
+        k, _, v = line.partition(":")
+        key = k.strip()
+        fm[key] = v.strip().strip('"').strip("'")
+    return fm
+
+
+@lru_cache(maxsize=8)
+def _load_skills_impl(md_files: tuple[Path, ...], mtimes: tuple[float, ...]) -> list[Skill]:
     skills = []
-    for md_file in sorted(skills_dir.glob("*.md")):
+    for md_file in md_files:
         text = md_file.read_text()
-        # Parse YAML frontmatter between --- markers
+        # Parse frontmatter between --- markers
         if not text.startswith("---"):
             continue
         end = text.index("---", 3)
-        frontmatter = yaml.safe_load(text[3:end])
+        frontmatter = _parse_frontmatter(text[3:end])
         body = text[end + 3 :].strip()
 
         skills.append(
@@ -34,3 +51,14 @@ def load_skills(skills_dir: str | Path = "skills") -> list[Skill]:
             )
         )
     return skills
+
+
+def load_skills(skills_dir: str | Path = "skills") -> list[Skill]:
+    """Glob all .md files in skills_dir, parse frontmatter, return Skill objects.
+
+    Results are cached by file mtimes, so repeated loads only re-parse
+    when a skill file actually changes.
+    """
+    md_files = tuple(sorted(Path(skills_dir).glob("*.md")))
+    mtimes = tuple(f.stat().st_mtime for f in md_files)
+    return _load_skills_impl(md_files, mtimes)
@@ -1,41 +1,100 @@
-from llm.client import LLMClient
+import re
+
+import numpy as np
+
 from skills.loader import Skill
 
-SELECTION_PROMPT = """Given this user request, which skill (if any) should be activated?
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+# Cosine similarity below this means "no skill applies"
+_MIN_SCORE = 0.18
+
+# Function words carry no routing signal but dominate short queries —
+# "what is ..." must not match a description that happens to contain
+# "what". "on"/"off" are deliberately kept: they're content words for
+# smart-home commands.
+_STOPWORDS = frozenset(
+    """
+    a about an and are as at be but by can could did do does for from get has
+    have how i if in into is it its me my no not of or our so some that the
+    their them then they this to up us use used user users was we what when
+    where which who why will with would you your
+    """.split()
+)
+
+
+def _tokenize(text: str) -> list[str]:
+    return [tok for tok in _TOKEN_RE.findall(text.lower()) if tok not in _STOPWORDS]
+
 
-Available skills:
-{skill_list}
+class SkillRegistry(list):
+    """A list of Skills plus a precomputed description index.
 
-User request: "{user_input}"
+    The skill set is fixed after startup, so each skill's name +
+    description is turned into a normalized TF-IDF row once here;
+    selection is then a single matrix-vector product instead of a
+    per-turn LLM round-trip. The lowercased name map keeps exact-name
+    lookups O(1).
+    """
+
+    def __init__(self, skills: list[Skill]):
+        super().__init__(skills)
+        self.by_name = {s.name.lower(): s for s in self}
+
+        docs = [_tokenize(f"{s.name.replace('-', ' ')} {s.description}") for s in self]
+        vocab: dict[str, int] = {}
+        for doc in docs:
+            for tok in doc:
+                vocab.setdefault(tok, len(vocab))
+        self._vocab = vocab
+
+        df = np.zeros(len(vocab))
+        for doc in docs:
+            for tok in set(doc):
+                df[vocab[tok]] += 1
+        self._idf = (np.log((len(docs) + 1) / (df + 1)) + 1.0).astype(np.float32)
 
-Respond with ONLY the skill name, or "none" if no skill applies. No explanation."""
+        mat = np.zeros((len(docs), len(vocab)), dtype=np.float32)
+        for i, doc in enumerate(docs):
+            for tok in doc:
+                mat[i, vocab[tok]] += 1
+        mat *= self._idf
+        norms = np.linalg.norm(mat, axis=1, keepdims=True)
+        np.divide(mat, norms, out=mat, where=norms > 0)
+        self._matrix = mat
+
+    def scores(self, text: str) -> np.ndarray:
+        """Cosine similarity of text against every skill description."""
+        vec = np.zeros(len(self._vocab), dtype=np.float32)
+        for tok in _tokenize(text):
+            idx = self._vocab.get(tok)
+            if idx is not None:
+                vec[idx] += 1
+        vec *= self._idf
+        norm = np.linalg.norm(vec)
+        if norm == 0:
+            return np.zeros(len(self), dtype=np.float32)
+        return self._matrix @ (vec / norm)
 
 
 async def select_skill(
     user_input: str,
     skills: list[Skill],
-    llm_client: LLMClient,
 ) -> Skill | None:
-    """Use LLM to select the best matching skill for user input.
+    """Match user input to the best skill by description similarity.
 
-    Stage 1 of the two-stage skill system. Only descriptions are sent,
-    not the full bodies — keeps this call cheap (~100 tokens).
+    Stage 1 of the two-stage skill system. This used to be a full LLM
+    call per turn just to pick one-of-N; a local TF-IDF cosine match is
+    sub-ms and keeps the round-trip off the critical path entirely.
     """
     if not skills:
         return None
 
-    skill_list = "\n".join(f"- {s.name}: {s.description}" for s in skills)
-    prompt = SELECTION_PROMPT.format(skill_list=skill_list, user_input=user_input)
-
-    result = await llm_client.chat_simple([{"role": "user", "content": prompt}])
-    result = result.strip().lower().strip('"').strip("'")
+    if not isinstance(skills, SkillRegistry):
+        skills = SkillRegistry(skills)
 
-    if result == "none":
+    scores = skills.scores(user_input)
+    best = int(np.argmax(scores))
+    if scores[best] < _MIN_SCORE:
         return None
-
-    # Match to skill by name
-    for skill in skills:
-        if skill.name.lower() == result:
-            return skill
-
-    return None
+    return skills[best]
@@ -18,7 +18,7 @@ def test_get_tools_returns_list():
 
 def test_get_tools_excludes_ha_when_disabled():
     config = load_config()
-    config.home_assistant.enabled = False
+    config = config.model_copy(update={"home_assistant": config.home_assistant.model_copy(update={"enabled": False})})
     tools = get_tools(config)
     tool_names = [t["function"]["name"] for t in tools]
     assert "ha_get_states" not in tool_names
@@ -27,7 +27,7 @@ def test_get_tools_excludes_ha_when_disabled():
 
 def test_get_tools_includes_ha_when_enabled():
     config = load_config()
-    config.home_assistant.enabled = True
+    config = config.model_copy(update={"home_assistant": config.home_assistant.model_copy(update={"enabled": True})})
     tools = get_tools(config)
     tool_names = [t["function"]["name"] for t in tools]
     assert "ha_get_states" in tool_names
@@ -91,6 +91,6 @@ async def test_llm_client_init():
 @pytest.mark.asyncio
 async def test_llm_client_local_init():
     config = load_config()
-    config.llm.backend = "local"
-    client = LLMClient(config.llm)
-    assert client.model == config.llm.local.model
+    llm_config = config.llm.model_copy(update={"backend": "local"})
+    client = LLMClient(llm_config)
+    assert client.model == llm_config.local.model
@@ -99,7 +99,7 @@ def test_interaction_record_with_skill():
 
 def test_create_memory_disabled():
     config = load_config()
-    config.memory.enabled = False
+    config = config.model_copy(update={"memory": config.memory.model_copy(update={"enabled": False})})
     learning, capture = create_memory(config)
     assert learning is None
     assert capture is None
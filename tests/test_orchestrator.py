@@ -76,11 +76,17 @@ async def test_orchestrator_process_simple():
     config = load_config()
     from core.orchestrator import Orchestrator
 
+    from core.types import StreamChunk, StreamChunkType
+
     mock_llm = MagicMock()
     # Skill selection returns "none"
     mock_llm.chat_simple = AsyncMock(return_value="none")
-    # Main LLM call returns text with no tool calls
-    mock_llm.chat = AsyncMock(return_value={"content": "Hello!", "tool_calls": None, "raw": None})
+
+    # Main LLM call streams text with no tool calls
+    async def fake_stream(messages, tools=None):
+        yield StreamChunk(type=StreamChunkType.TEXT, content="Hello!")
+
+    mock_llm.chat_stream = fake_stream
     mock_executor = MagicMock()
 
     orch = Orchestrator(config=config, llm_client=mock_llm, executor=mock_executor)
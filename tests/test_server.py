@@ -17,7 +17,7 @@ def test_audio_handler_init():
     assert handler.ws is mock_ws
     assert handler.pipeline is mock_pipeline
     assert handler._ptt_active is False
-    assert handler._ptt_buffer == bytearray()
+    assert handler._ptt_buffer == []
 
 
 def test_audio_handler_sets_callbacks():
@@ -73,11 +73,11 @@ async def test_audio_handler_ptt_stop_with_audio():
     handler = AudioHandler(mock_ws, mock_pipeline)
 
     handler._ptt_active = True
-    handler._ptt_buffer = bytearray(b"\x00\x01\x02\x03")
+    handler._ptt_buffer = [b"\x00\x01", b"\x02\x03"]
     await handler._handle_control({"type": "push_to_talk", "state": "stop"})
     assert handler._ptt_active is False
-    mock_pipeline.process_push_to_talk.assert_called_once()
-    assert handler._ptt_buffer == bytearray()
+    mock_pipeline.process_push_to_talk.assert_called_once_with(b"\x00\x01\x02\x03")
+    assert handler._ptt_buffer == []
 
 
 @pytest.mark.asyncio
@@ -90,7 +90,8 @@ async def test_audio_handler_state_change_callback():
     handler = AudioHandler(mock_ws, mock_pipeline)
 
     await handler._on_state_change(PipelineState.LISTENING)
-    mock_ws.send_json.assert_called_with({"type": "state", "pipeline": "listening"})
+    sent = json.loads(mock_ws.send_text.call_args.args[0])
+    assert sent == {"type": "state", "pipeline": "listening"}
 
 
 @pytest.mark.asyncio
@@ -117,7 +118,8 @@ async def test_audio_handler_transcript_callback():
     handler = AudioHandler(mock_ws, mock_pipeline)
 
     await handler._on_transcript("hello world", False)
-    mock_ws.send_json.assert_called_with({"type": "transcript", "text": "hello world", "partial": False})
+    sent = json.loads(mock_ws.send_text.call_args.args[0])
+    assert sent == {"type": "transcript", "text": "hello world", "partial": False}
 
 
 @pytest.mark.asyncio
@@ -131,11 +133,12 @@ async def test_audio_handler_stream_chunk_text():
 
     chunk = StreamChunk(type=StreamChunkType.TEXT, content="Here's what I found")
     await handler._on_stream_chunk(chunk)
-    mock_ws.send_json.assert_called_with({
+    sent = json.loads(mock_ws.send_text.call_args.args[0])
+    assert sent == {
         "type": "response",
         "text": "Here's what I found",
         "tools_used": [],
-    })
+    }
 
 
 @pytest.mark.asyncio
@@ -149,7 +152,8 @@ async def test_audio_handler_stream_chunk_thinking():
 
     chunk = StreamChunk(type=StreamChunkType.THINKING, content="Processing...")
     await handler._on_stream_chunk(chunk)
-    mock_ws.send_json.assert_called_with({"type": "thinking", "text": "Processing..."})
+    sent = json.loads(mock_ws.send_text.call_args.args[0])
+    assert sent == {"type": "thinking", "text": "Processing..."}
 
 
 @pytest.mark.asyncio
@@ -164,13 +168,13 @@ async def test_audio_handler_text_input():
         return_value=Response(text="Hello!", tool_calls_made=[], latency_ms={})
     )
     mock_pipeline.tts = MagicMock()
-    mock_pipeline.tts.synthesize = AsyncMock(return_value=np.zeros(100, dtype=np.float32))
+    mock_pipeline.tts.synthesize = AsyncMock(return_value=np.zeros(100, dtype=np.int16).tobytes())
     handler = AudioHandler(mock_ws, mock_pipeline)
 
     await handler._handle_control({"type": "text_input", "text": "Hi there"})
     mock_pipeline.orchestrator.process.assert_called_once_with("Hi there")
     # Should send JSON response + binary audio
-    assert mock_ws.send_json.called
+    assert mock_ws.send_text.called
     assert mock_ws.send_bytes.called
 
 
@@ -49,3 +49,44 @@ def test_home_assistant_has_domains():
     ha = next(s for s in skills if s.name == "home-assistant")
     assert "ha_call_service" in ha.body
     assert "ha_get_states" in ha.body
+
+
+async def test_selector_picks_system_debug():
+    from skills.selector import select_skill
+
+    skills = load_skills("skills")
+    skill = await select_skill("debug why the server is slow", skills)
+    assert skill is not None
+    assert skill.name == "system-debug"
+
+
+async def test_selector_picks_home_assistant():
+    from skills.selector import select_skill
+
+    skills = load_skills("skills")
+    skill = await select_skill("turn on the living room lights", skills)
+    assert skill is not None
+    assert skill.name == "home-assistant"
+
+
+async def test_selector_picks_self_demo():
+    from skills.selector import select_skill
+
+    skills = load_skills("skills")
+    skill = await select_skill("demo yourself", skills)
+    assert skill is not None
+    assert skill.name == "self-demo"
+
+
+async def test_selector_rejects_generic_input():
+    from skills.selector import select_skill
+
+    skills = load_skills("skills")
+    for text in ("what is 2+2", "what time is it", "what's the weather", "hello", "how are you"):
+        assert await select_skill(text, skills) is None, f"{text!r} should select no skill"
+
+
+async def test_selector_empty_skill_list():
+    from skills.selector import select_skill
+
+    assert await select_skill("debug the server", []) is None
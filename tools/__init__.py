@@ -1,4 +1,7 @@
-from core.config import Config
+from functools import partial
+from typing import Any
+
+from core.config import Config, HomeAssistantConfig
 from tools.executor import ToolExecutor
 from tools.filesystem import list_directory, read_file, search_files, write_file
 from tools.home_assistant import HomeAssistantTools
@@ -8,9 +11,44 @@ from tools.shell import run_shell
 from tools.web_search import fetch_page, web_search
 
 
-def register_all_tools(executor: ToolExecutor, config: Config) -> None:
+class LazyHomeAssistant:
+    """Defers HomeAssistantTools (and its HTTP pool) to first tool call.
+
+    Voice-only sessions never pay for the HA connection pool; the real
+    instance is built once, on the first ha_* invocation.
+    """
+
+    def __init__(self, config: HomeAssistantConfig):
+        self._config = config
+        self._ha: HomeAssistantTools | None = None
+
+    def _get(self) -> HomeAssistantTools:
+        if self._ha is None:
+            self._ha = HomeAssistantTools(self._config)
+        return self._ha
+
+    def handler(self, name: str):
+        async def call(**kwargs: Any) -> str:
+            return await getattr(self._get(), name)(**kwargs)
+
+        call.__name__ = name
+        return call
+
+    async def aclose(self) -> None:
+        if self._ha is not None:
+            await self._ha.aclose()
+
+
+def register_all_tools(executor: ToolExecutor, config: Config) -> LazyHomeAssistant | None:
+    """Register all tool handlers.
+
+    Returns the lazy Home Assistant wrapper (if enabled) so callers can
+    aclose() its HTTP client on shutdown.
+    """
     executor.register("run_shell", run_shell)
-    executor.register("read_file", read_file)
+    # Bound read: stays within the executor's output budget without
+    # buffering whole files first
+    executor.register("read_file", partial(read_file, max_chars=config.tools.output_max_chars))
     executor.register("write_file", write_file)
     executor.register("list_directory", list_directory)
     executor.register("search_files", search_files)
@@ -22,9 +60,8 @@ def register_all_tools(executor: ToolExecutor, config: Config) -> None:
     executor.register("fetch_page", fetch_page)
 
     if config.home_assistant.enabled:
-        ha = HomeAssistantTools(config.home_assistant)
-        executor.register("ha_get_states", ha.ha_get_states)
-        executor.register("ha_get_state", ha.ha_get_state)
-        executor.register("ha_set_state", ha.ha_set_state)
-        executor.register("ha_call_service", ha.ha_call_service)
-        executor.register("ha_get_history", ha.ha_get_history)
+        ha = LazyHomeAssistant(config.home_assistant)
+        for name in ("ha_get_states", "ha_get_state", "ha_set_state", "ha_call_service", "ha_get_history"):
+            executor.register(name, ha.handler(name))
+        return ha
+    return None
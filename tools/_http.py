@@ -0,0 +1,29 @@
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Process-wide pooled client for tool HTTP fetches.
+
+    Chain-called fetches (the LLM reading several URLs in one turn)
+    reuse DNS results and keep-alive/HTTP2 connections instead of
+    paying a fresh TCP+TLS setup per call.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared client — called at app shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,3 +1,4 @@
+import inspect
 import re
 from collections.abc import Callable, Coroutine
 from typing import Any
@@ -47,38 +48,47 @@ Handler = Callable[..., Coroutine[Any, Any, Any]]
 class ToolExecutor:
     def __init__(self, config: ToolsConfig):
         self.config = config
-        self._handlers: dict[str, Handler] = {}
+        # name -> (handler, accepted arg names); the signature is
+        # inspected once at register time, not per call
+        self._handlers: dict[str, tuple[Handler, frozenset[str] | None]] = {}
+        # Hoisted from the per-call path in execute()
+        self._max_chars = config.output_max_chars
+        self._trunc_suffix = "\n...(truncated)"
+        # One combined alternation: blocked commands (plain substrings,
+        # escaped) plus the dangerous patterns — classify_risk does a
+        # single C-level scan instead of two loops
+        danger = [f"(?:{re.escape(b)})" for b in config.blocked_commands]
+        danger += (f"(?:{p})" for p in DANGEROUS_PATTERNS)
+        self._danger_re = re.compile("|".join(danger))
         # Confirmation callback — set by server/orchestrator
         self.on_confirm_request: Callable[[ToolCall], Coroutine[Any, Any, bool]] | None = None
 
     def register(self, name: str, handler: Handler) -> None:
-        self._handlers[name] = handler
+        params = inspect.signature(handler).parameters
+        if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+            argset = None  # **kwargs — accepts anything
+        else:
+            argset = frozenset(params)
+        self._handlers[name] = (handler, argset)
 
     def classify_risk(self, tool_call: ToolCall) -> RiskLevel:
         base_risk = RISK_MAP.get(tool_call.name, RiskLevel.MODERATE)
 
         # Dynamic upgrade for shell commands
-        if tool_call.name == "run_shell":
-            command = tool_call.args.get("command", "")
-            # Check blocked commands
-            for blocked in self.config.blocked_commands:
-                if blocked in command:
-                    return RiskLevel.DANGEROUS
-            # Check dangerous patterns
-            for pattern in DANGEROUS_PATTERNS:
-                if re.search(pattern, command):
-                    return RiskLevel.DANGEROUS
+        if tool_call.name == "run_shell" and self._danger_re.search(tool_call.args.get("command", "")):
+            return RiskLevel.DANGEROUS
 
         return base_risk
 
     async def execute(self, tool_call: ToolCall) -> ToolResult:
-        handler = self._handlers.get(tool_call.name)
-        if not handler:
+        entry = self._handlers.get(tool_call.name)
+        if not entry:
             return ToolResult(
                 tool_call_id=tool_call.id,
                 content=f"Unknown tool: {tool_call.name}",
                 is_error=True,
             )
+        handler, argset = entry
 
         risk = self.classify_risk(tool_call)
 
@@ -91,11 +101,27 @@ class ToolExecutor:
                     content="Operation cancelled by user.",
                 )
 
+        args = tool_call.args
+        if argset is not None and not (args.keys() <= argset):
+            # Hallucinated/misspelled args: surface them so the LLM can
+            # correct — silently dropping one (e.g. a misspelled optional)
+            # would run the tool with defaults and return plausible but
+            # wrong output
+            unknown = ", ".join(sorted(args.keys() - argset))
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                content=(
+                    f"Unknown argument(s) for {tool_call.name}: {unknown}. "
+                    f"Accepted: {', '.join(sorted(argset))}"
+                ),
+                is_error=True,
+            )
+
         try:
-            result = await handler(**tool_call.args)
+            result = await handler(**args)
             # Truncate long output
-            if isinstance(result, str) and len(result) > self.config.output_max_chars:
-                result = result[: self.config.output_max_chars] + "\n...(truncated)"
+            if type(result) is str and len(result) > self._max_chars:
+                result = result[: self._max_chars] + self._trunc_suffix
             return ToolResult(tool_call_id=tool_call.id, content=str(result))
         except Exception as e:
             return ToolResult(
@@ -1,40 +1,74 @@
-import glob as glob_module
+import asyncio
 import os
+from pathlib import Path
 
-import aiofiles
+_TRUNC_SUFFIX = "\n...(truncated)"
 
+# search_files stops after this many hits — keeps huge trees from
+# blowing up memory and sort time (the LLM never needs more anyway)
+_SEARCH_CAP = 500
 
-async def read_file(path: str) -> str:
-    path = os.path.expanduser(path)
-    async with aiofiles.open(path) as f:
-        content: str = await f.read()
-        return content
 
+def _read_sync(path: str, max_chars: int | None) -> str:
+    with open(path, errors="replace") as f:
+        if max_chars is None:
+            return f.read()
+        # Read only one char past the limit — a multi-MB file never
+        # gets materialized just to be cut down by the executor
+        content = f.read(max_chars + 1)
+    if len(content) > max_chars:
+        content = content[: max_chars - len(_TRUNC_SUFFIX)] + _TRUNC_SUFFIX
+    return content
 
-async def write_file(path: str, content: str) -> str:
-    path = os.path.expanduser(path)
+
+def _write_sync(path: str, content: str) -> None:
     parent = os.path.dirname(path)
     if parent:
         os.makedirs(parent, exist_ok=True)
-    async with aiofiles.open(path, "w") as f:
-        await f.write(content)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+async def read_file(path: str, max_chars: int | None = None) -> str:
+    # One thread hop for the whole read — small files (the common case)
+    # pay less dispatch overhead than per-chunk aiofiles wrappers
+    path = os.path.expanduser(path)
+    return await asyncio.to_thread(_read_sync, path, max_chars)
+
+
+async def write_file(path: str, content: str) -> str:
+    path = os.path.expanduser(path)
+    await asyncio.to_thread(_write_sync, path, content)
     return f"Written {len(content)} bytes to {path}"
 
 
 async def list_directory(path: str = ".") -> str:
     path = os.path.expanduser(path)
-    entries = []
-    for entry in sorted(os.scandir(path), key=lambda e: e.name):
-        prefix = "[DIR] " if entry.is_dir() else "[FILE]"
-        size = ""
-        if entry.is_file():
-            size = f" ({entry.stat().st_size} bytes)"
-        entries.append(f"{prefix} {entry.name}{size}")
-    return "\n".join(entries) or "(empty directory)"
+    # Single pass: DirEntry caches the readdir d_type and the lstat, so
+    # each entry costs at most one syscall beyond the directory read
+    rows = []
+    for entry in os.scandir(path):
+        is_file = entry.is_file(follow_symlinks=False)
+        size = entry.stat(follow_symlinks=False).st_size if is_file else 0
+        rows.append((entry.name, entry.is_dir(), is_file, size))
+    rows.sort()
+    lines = [
+        f"{'[DIR] ' if is_dir else '[FILE]'} {name}{f' ({size} bytes)' if is_file else ''}"
+        for name, is_dir, is_file, size in rows
+    ]
+    return "\n".join(lines) or "(empty directory)"
+
+
+def _search_sync(pattern: str, path: str) -> str:
+    matches = []
+    for p in Path(path).rglob(pattern):
+        matches.append(str(p))
+        if len(matches) >= _SEARCH_CAP:
+            break
+    matches.sort()
+    return "\n".join(matches) or "(no matches)"
 
 
 async def search_files(pattern: str, path: str = ".") -> str:
     path = os.path.expanduser(path)
-    full_pattern = os.path.join(path, pattern)
-    matches = glob_module.glob(full_pattern, recursive=True)
-    return "\n".join(sorted(matches)) or "(no matches)"
+    return await asyncio.to_thread(_search_sync, pattern, path)
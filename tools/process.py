@@ -1,9 +1,11 @@
+import asyncio
+import heapq
 from typing import Any
 
 import psutil
 
 
-async def list_processes(sort_by: str = "cpu") -> str:
+def _scan_processes(key: str) -> list[dict[str, Any]]:
     procs: list[dict[str, Any]] = []
     for p in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent"]):
         try:
@@ -11,12 +13,18 @@ async def list_processes(sort_by: str = "cpu") -> str:
             procs.append(info)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
+    # Top-15 via a bounded heap — no full sort of every process
+    return heapq.nlargest(15, procs, key=lambda x: x.get(key, 0) or 0)
+
 
+async def list_processes(sort_by: str = "cpu") -> str:
     key = "cpu_percent" if sort_by == "cpu" else "memory_percent"
-    procs.sort(key=lambda x: x.get(key, 0) or 0, reverse=True)
+    # process_iter issues several syscalls per process — keep that off
+    # the event loop
+    top = await asyncio.to_thread(_scan_processes, key)
 
     lines = [f"{'PID':<8} {'CPU%':<8} {'MEM%':<8} {'NAME'}"]
-    for proc in procs[:15]:
+    for proc in top:
         lines.append(f"{proc['pid']:<8} {proc.get('cpu_percent', 0):<8.1f} {proc.get('memory_percent', 0):<8.1f} {proc['name']}")
     return "\n".join(lines)
 
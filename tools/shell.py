@@ -1,8 +1,13 @@
 import asyncio
 
+# Resolved once — create_subprocess_shell re-derives the shell per call
+_SH = "/bin/sh"
+
 
 async def run_shell(command: str, timeout: int = 30) -> str:
-    proc = await asyncio.create_subprocess_shell(
+    proc = await asyncio.create_subprocess_exec(
+        _SH,
+        "-c",
         command,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
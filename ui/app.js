@@ -86,6 +86,10 @@
     // --- Message handling ---
     function handleMessage(msg) {
         switch (msg.type) {
+            case 'batch':
+                // Server coalesces rapid-fire frames into one message
+                msg.messages.forEach(handleMessage);
+                break;
             case 'transcript':
                 appendLog('user', msg.text);
                 break;
@@ -1,4 +1,7 @@
+import asyncio
+import time
 from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
@@ -12,23 +15,54 @@ from voice.vad import SileroVAD
 # Type alias for async callbacks
 AsyncCallback = Callable[..., Coroutine[Any, Any, None]]
 
+# A transcript worth sending to the orchestrator — STT returns bare
+# punctuation often enough that .strip() alone lets LLM calls through
+# for nothing. str.isalnum() keeps this Unicode-aware: Voxtral is
+# multilingual, so Cyrillic/CJK/Arabic transcripts must pass
+def _is_meaningful(transcript: str) -> bool:
+    return any(c.isalnum() for c in transcript)
+
 
 class VoicePipeline:
     """State machine: IDLE → LISTENING → PROCESSING → SPEAKING → IDLE."""
 
+    # Silero's native frame at 16kHz — client chunks (480 samples) are
+    # re-framed through the ring buffer to this size
+    _VAD_FRAME = 512
+
+    # Utterance staging cap: 30s of 16kHz int16. If VAD misses an end
+    # (e.g. steady background noise), drop the oldest half rather than
+    # growing without bound
+    _MAX_BUFFER_BYTES = 16000 * 2 * 30
+
     def __init__(
         self,
         orchestrator: Orchestrator,
         stt: STTEngine,
         tts: TTSEngine,
         vad: SileroVAD,
+        min_rms: float = 0.005,
+        min_utterance_ms: int = 250,
     ):
         self.orchestrator = orchestrator
         self.stt = stt
         self.tts = tts
         self.vad = vad
+        # Utterances below either floor skip the STT round-trip
+        self._min_rms = min_rms
+        self._min_samples = 16000 * min_utterance_ms // 1000
         self.state = PipelineState.IDLE
-        self._audio_buffer: list[np.ndarray] = []
+        # Raw int16 PCM chunks as received — STT consumes these directly,
+        # so only the VAD path pays for the float32 conversion
+        self._audio_buffer: list[bytes] = []
+        self._buffered_bytes = 0
+        # Ring buffer re-framing incoming chunks into 512-sample VAD
+        # frames; also serves as the reusable int16→f32 scratch space
+        self._vad_ring = np.empty(2048, dtype=np.float32)
+        self._vad_fill = 0
+        # VAD inference runs off-loop (ORT releases the GIL during
+        # session.run); a single worker keeps the stateful frames ordered
+        self._vad_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vad")
 
         # Callbacks — set by server/WebSocket handler
         self.on_state_change: AsyncCallback | None = None
@@ -38,15 +72,20 @@ class VoicePipeline:
 
     async def _set_state(self, new_state: PipelineState) -> None:
         self.state = new_state
+        # One notification per transition: the stream-chunk broadcast is
+        # a fallback for consumers without a dedicated state callback —
+        # firing both doubled the scheduler hops for the same event
         if self.on_state_change:
             await self.on_state_change(new_state)
-        if self.on_stream_chunk:
+        elif self.on_stream_chunk:
             await self.on_stream_chunk(StreamChunk(type=StreamChunkType.STATE, content=new_state.value))
 
     async def feed_audio(self, chunk: bytes) -> None:
         """Feed raw PCM int16 audio from the client.
 
-        Each chunk should be 480 samples (30ms at 16kHz) = 960 bytes.
+        Client chunks are typically 480 samples (30ms at 16kHz) = 960
+        bytes; the ring buffer re-frames them into whole 512-sample
+        frames before the VAD sees them.
         """
         # Ignore audio while speaking (no barge-in for hackathon)
         if self.state == PipelineState.SPEAKING:
@@ -55,33 +94,69 @@ class VoicePipeline:
         if self.state == PipelineState.PROCESSING:
             return
 
-        # Convert int16 PCM bytes → float32 numpy
         audio_int16 = np.frombuffer(chunk, dtype=np.int16)
-        audio_float = audio_int16.astype(np.float32) / 32768.0
+        n = len(audio_int16)
+        ring = self._vad_ring
+        fill = self._vad_fill
+        if fill + n > len(ring):
+            ring = np.empty(max(len(ring) * 2, fill + n), dtype=np.float32)
+            ring[:fill] = self._vad_ring[:fill]
+            self._vad_ring = ring
+        # Fused int16→f32 cast+scale straight into the ring — no temporaries
+        np.multiply(audio_int16, np.float32(1.0 / 32768.0), out=ring[fill : fill + n])
+        fill += n
 
-        # Run VAD
-        vad_result = self.vad.process_chunk(audio_float)
+        # Drain whole frames through VAD, aggregating edge events —
+        # one model call per 512 samples instead of one per chunk
+        speech_start = False
+        speech_end = False
+        offset = 0
+        frame = self._VAD_FRAME
+        loop = asyncio.get_running_loop()
+        while fill - offset >= frame:
+            # Awaited per frame, so the single-threaded executor never
+            # sees two frames in flight and state stays sequential
+            vad_result = await loop.run_in_executor(
+                self._vad_exec, self.vad.process_chunk, ring[offset : offset + frame]
+            )
+            speech_start = speech_start or vad_result["speech_start"]
+            speech_end = speech_end or vad_result["speech_end"]
+            offset += frame
 
-        if vad_result["speech_start"]:
+        if speech_start:
             await self._set_state(PipelineState.LISTENING)
             self._audio_buffer.clear()
+            self._buffered_bytes = 0
 
         if self.state == PipelineState.LISTENING:
-            self._audio_buffer.append(audio_float)
+            self._audio_buffer.append(chunk)
+            self._buffered_bytes += len(chunk)
+            if self._buffered_bytes > self._MAX_BUFFER_BYTES:
+                while self._buffered_bytes > self._MAX_BUFFER_BYTES // 2:
+                    self._buffered_bytes -= len(self._audio_buffer.pop(0))
 
-        if vad_result["speech_end"] and self.state == PipelineState.LISTENING:
+        # Shift the partial frame to the front for the next chunk
+        if offset:
+            remaining = fill - offset
+            if remaining:
+                ring[:remaining] = ring[offset:fill]
+            fill = remaining
+        self._vad_fill = fill
+
+        if speech_end and self.state == PipelineState.LISTENING:
             await self._process_utterance()
 
     async def process_push_to_talk(self, audio_data: bytes) -> None:
         """Bypass VAD — process a complete audio chunk directly."""
-        audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
-        audio_float = audio_int16.astype(np.float32) / 32768.0
-        self._audio_buffer = [audio_float]
+        # STT takes raw int16 PCM, so no conversion is needed at all
+        self._audio_buffer = [audio_data]
         await self._process_utterance()
 
     async def _process_utterance(self) -> None:
         """Full pipeline: STT → Orchestrator → TTS with latency tracking."""
-        import time
+        # Monotonic integer ns — immune to wall-clock jumps, no float
+        # round-off when phases are summed
+        clock = time.perf_counter_ns
 
         timing: dict[str, float] = {}
         await self._set_state(PipelineState.PROCESSING)
@@ -91,28 +166,45 @@ class VoicePipeline:
             await self._set_state(PipelineState.IDLE)
             return
 
-        audio = np.concatenate(self._audio_buffer)
+        pcm16 = b"".join(self._audio_buffer)
         self._audio_buffer.clear()
+        self._buffered_bytes = 0
         self.vad.reset()
+        self._vad_fill = 0
+
+        # Energy fast-path: a VAD blip on background noise shouldn't pay
+        # the remote STT round-trip
+        samples = np.frombuffer(pcm16, dtype=np.int16)
+        quiet = len(samples) < self._min_samples
+        if not quiet:
+            rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float32)))) / 32768.0
+            quiet = rms < self._min_rms
+        if quiet:
+            if self.on_stream_chunk:
+                await self.on_stream_chunk(
+                    StreamChunk(type=StreamChunkType.TEXT, content="I didn't catch that. Could you repeat?")
+                )
+            await self._set_state(PipelineState.IDLE)
+            return
 
         # --- STT ---
-        t0 = time.time()
+        t0 = clock()
         try:
-            transcript = await self.stt.transcribe(audio)
+            transcript = await self.stt.transcribe(pcm16)
         except Exception as e:
             transcript = ""
             if self.on_stream_chunk:
                 await self.on_stream_chunk(
                     StreamChunk(type=StreamChunkType.TEXT, content=f"I couldn't process the audio: {e}")
                 )
-        timing["stt"] = (time.time() - t0) * 1000
+        timing["stt"] = (clock() - t0) // 1_000_000
 
         if self.on_transcript:
             await self.on_transcript(transcript, False)
         if self.on_stream_chunk:
             await self.on_stream_chunk(StreamChunk(type=StreamChunkType.TRANSCRIPT, content=transcript))
 
-        if not transcript.strip():
+        if not _is_meaningful(transcript):
             if self.on_stream_chunk:
                 await self.on_stream_chunk(
                     StreamChunk(type=StreamChunkType.TEXT, content="I didn't catch that. Could you repeat?")
@@ -121,7 +213,7 @@ class VoicePipeline:
             return
 
         # --- Orchestrator ---
-        t0 = time.time()
+        t0 = clock()
         try:
             response = await self.orchestrator.process(transcript)
         except Exception as e:
@@ -134,7 +226,7 @@ class VoicePipeline:
                 )
             await self._set_state(PipelineState.IDLE)
             return
-        timing["orchestrator"] = (time.time() - t0) * 1000
+        timing["orchestrator"] = (clock() - t0) // 1_000_000
         timing.update(response.latency_ms)
 
         if self.on_stream_chunk:
@@ -145,27 +237,29 @@ class VoicePipeline:
             return
 
         # --- TTS ---
+        # SPEAKING flips before the first await so the UI updates while
+        # the synthesis request is still in flight
         await self._set_state(PipelineState.SPEAKING)
 
-        t0 = time.time()
+        t0 = clock()
         try:
-            tts_audio = await self.tts.synthesize(response.text)
-            # Convert float32 → int16 PCM bytes for client
-            audio_int16 = (tts_audio * 32767).astype(np.int16)
-            audio_bytes = audio_int16.tobytes()
-
-            if self.on_audio_out:
-                await self.on_audio_out(audio_bytes)
-            if self.on_stream_chunk:
-                await self.on_stream_chunk(StreamChunk(type=StreamChunkType.AUDIO, content=audio_bytes))
+            # Stream PCM16 blocks out as they arrive — the client starts
+            # playback before the whole utterance is synthesized
+            async for block in self.tts.synthesize_stream(response.text):
+                if self.on_audio_out:
+                    await self.on_audio_out(block)
+                if self.on_stream_chunk:
+                    await self.on_stream_chunk(StreamChunk(type=StreamChunkType.AUDIO, content=block))
         except Exception as e:
             # TTS failed — still return text response (just no audio)
             if self.on_stream_chunk:
                 await self.on_stream_chunk(
                     StreamChunk(type=StreamChunkType.TEXT, content=f"(Voice unavailable: {e})")
                 )
-        timing["tts"] = (time.time() - t0) * 1000
-        timing["total"] = sum(timing.values())
+        timing["tts"] = (clock() - t0) // 1_000_000
+        # Only the top-level phases — latency_ms sub-timings merged from
+        # the orchestrator are already inside its phase entry
+        timing["total"] = timing["stt"] + timing["orchestrator"] + timing["tts"]
 
         # Send latency info to client
         if self.on_stream_chunk:
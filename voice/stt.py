@@ -1,18 +1,42 @@
-import io
 import os
+import struct
 from abc import ABC, abstractmethod
 
 import httpx
-import numpy as np
-import soundfile as sf  # type: ignore[import-untyped]
 
 from core.config import STTConfig
 
 
+def _wav_header(n_bytes: int, sample_rate: int) -> bytes:
+    """Build a 44-byte mono PCM16 WAV header for a payload of n_bytes."""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + n_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        1,  # mono
+        sample_rate,
+        sample_rate * 2,  # byte rate (2 bytes/sample)
+        2,  # block align
+        16,  # bits per sample
+        b"data",
+        n_bytes,
+    )
+
+
 class STTEngine(ABC):
     @abstractmethod
-    async def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
-        """Transcribe audio to text."""
+    async def transcribe(self, pcm16: bytes, sample_rate: int = 16000) -> str:
+        """Transcribe int16 PCM audio to text."""
+
+    async def aclose(self) -> None:
+        """Release engine resources (HTTP pools etc.)."""
+
+    async def warmup(self) -> None:
+        """Prime connections/caches so the first turn pays no cold start."""
 
 
 class MistralSTTAPI(STTEngine):
@@ -21,30 +45,47 @@ class MistralSTTAPI(STTEngine):
     def __init__(self, config: STTConfig):
         self.base_url = config.api.base_url
         self.api_key = os.environ.get(config.api.api_key_env, "")
+        # One long-lived client — per-call AsyncClient construction paid
+        # a fresh DNS lookup + TLS handshake on every utterance
+        self._client = httpx.AsyncClient(
+            timeout=30,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+
+    async def transcribe(self, pcm16: bytes, sample_rate: int = 16000) -> str:
+        # The client already sends int16 PCM, so the upload is just a
+        # 44-byte header prepended to the raw bytes — no float round-trip
+        # through soundfile and no intermediate BytesIO
+        wav_bytes = _wav_header(len(pcm16), sample_rate) + pcm16
+
+        resp = await self._client.post(
+            self.base_url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            files={"file": ("audio.wav", wav_bytes, "audio/wav")},
+            data={"model": "voxtral-mini-latest"},
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        text: str = data.get("text", "")
+        return text
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
 
-    async def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
-        # Convert numpy → WAV bytes
-        wav_buffer = io.BytesIO()
-        sf.write(wav_buffer, audio, sample_rate, format="WAV", subtype="PCM_16")
-        wav_bytes = wav_buffer.getvalue()
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                self.base_url,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                files={"file": ("audio.wav", wav_bytes, "audio/wav")},
-                data={"model": "voxtral-mini-latest"},
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            text: str = data.get("text", "")
-            return text
+    async def warmup(self) -> None:
+        # 100ms of silence — the transcript is discarded; the point is
+        # the DNS lookup + TLS handshake happening before the first turn
+        try:
+            await self.transcribe(b"\x00" * 3200)
+        except Exception:
+            pass  # connection is warm even if the endpoint rejects silence
 
 
 class LocalSTT(STTEngine):
     """Placeholder for local Voxtral Realtime inference."""
 
-    async def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
+    async def transcribe(self, pcm16: bytes, sample_rate: int = 16000) -> str:
         raise NotImplementedError("Local STT not yet implemented — use API mode")
 
 
@@ -1,41 +1,108 @@
-import io
 import os
 import re
+import struct
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from hashlib import blake2b
 
 import httpx
 import numpy as np
-import soundfile as sf  # type: ignore[import-untyped]
 
 from core.config import TTSConfig
 
 
 class TTSEngine(ABC):
     @abstractmethod
-    async def synthesize(self, text: str) -> np.ndarray:
-        """Synthesize text to audio."""
+    async def synthesize(self, text: str) -> bytes:
+        """Synthesize text to int16 PCM bytes."""
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """Yield int16 PCM blocks as they become available.
+
+        Default implementation yields the full synthesize() output as a
+        single block; streaming backends override this.
+        """
+        audio = await self.synthesize(text)
+        if audio:
+            yield audio
+
+    async def aclose(self) -> None:
+        """Release engine resources (HTTP pools etc.)."""
+
+    async def warmup(self) -> None:
+        """Prime connections/caches so the first turn pays no cold start."""
+
+
+def _to_pcm16(audio: np.ndarray) -> bytes:
+    """Convert float32 audio in [-1, 1] to int16 PCM bytes in place.
+
+    Scaling and clipping reuse the float buffer, so the only new
+    allocation is the int16 output — callers forward it unmodified.
+    """
+    np.multiply(audio, 32767.0, out=audio)
+    np.clip(audio, -32768, 32767, out=audio)
+    return audio.astype(np.int16, copy=False).tobytes()
+
+
+# Markdown-stripping pipeline, compiled once — preprocess runs per
+# utterance on the voice hot path
+_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```")
+_INLINE_CODE_RE = re.compile(r"`[^`]+`")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_EMPHASIS_RE = re.compile(r"[*_]{1,3}([^*_]+)[*_]{1,3}")
+_HEADER_RE = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
+# Any character that could start markdown syntax — most spoken replies
+# have none, so one scan decides whether the strip passes run at all
+_MARKDOWN_CHAR_RE = re.compile(r"[`\[\]*_#]")
 
 
 def preprocess_tts_text(text: str, max_chars: int = 1000) -> str:
     """Clean text for TTS: strip markdown, code blocks, links."""
-    # Remove code blocks
-    text = re.sub(r"```[\s\S]*?```", " [code block omitted] ", text)
-    # Remove inline code
-    text = re.sub(r"`[^`]+`", "", text)
-    # Remove markdown links, keep text
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-    # Remove markdown bold/italic
-    text = re.sub(r"[*_]{1,3}([^*_]+)[*_]{1,3}", r"\1", text)
-    # Remove headers
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
-    # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    # Truncate
+    if _MARKDOWN_CHAR_RE.search(text) is None:
+        # Fast path: plain prose needs only whitespace collapse —
+        # a single pass instead of the full six-pattern pipeline
+        text = _WHITESPACE_RE.sub(" ", text).strip()
+        if len(text) > max_chars:
+            text = text[:max_chars] + "..."
+        return text
+    text = _CODE_BLOCK_RE.sub(" [code block omitted] ", text)
+    text = _INLINE_CODE_RE.sub("", text)
+    text = _LINK_RE.sub(r"\1", text)  # keep link text
+    text = _EMPHASIS_RE.sub(r"\1", text)
+    text = _HEADER_RE.sub("", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     if len(text) > max_chars:
         text = text[:max_chars] + "..."
     return text
 
 
+def _parse_wav_header(buf: bytes) -> tuple[int, int, int] | None:
+    """Walk RIFF chunks up to "data".
+
+    Returns (audio_format, bytes_per_sample, data_offset), or None if
+    buf doesn't yet hold the full header.
+    """
+    if len(buf) < 12:
+        return None
+    audio_format = 1  # PCM
+    bits = 16
+    pos = 12
+    while pos + 8 <= len(buf):
+        chunk_id = buf[pos : pos + 4]
+        (size,) = struct.unpack_from("<I", buf, pos + 4)
+        if chunk_id == b"data":
+            return audio_format, bits // 8, pos + 8
+        if pos + 8 + size > len(buf):
+            return None
+        if chunk_id == b"fmt ":
+            (audio_format,) = struct.unpack_from("<H", buf, pos + 8)
+            (bits,) = struct.unpack_from("<H", buf, pos + 22)
+        pos += 8 + size + (size & 1)
+    return None
+
+
 class RivaTTSAPI(TTSEngine):
     """NVIDIA Riva TTS NIM API for text-to-speech."""
 
@@ -43,44 +110,147 @@ class RivaTTSAPI(TTSEngine):
         self.base_url = config.api.base_url
         self.api_key = os.environ.get(config.api.api_key_env, "")
         self.voice = config.api.voice
+        # One long-lived client — per-call AsyncClient construction paid
+        # a fresh DNS lookup + TLS handshake on every utterance
+        self._client = httpx.AsyncClient(
+            timeout=30,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+
+    async def synthesize(self, text: str) -> bytes:
+        return b"".join([block async for block in self.synthesize_stream(text)])
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
 
-    async def synthesize(self, text: str) -> np.ndarray:
+    async def warmup(self) -> None:
+        # Minimal synthesis, result discarded — pays the DNS + TLS cost
+        # at startup instead of on the first spoken reply
+        try:
+            await self.synthesize(".")
+        except Exception:
+            pass  # connection is warm even if the request fails
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """Stream PCM16 blocks as WAV bytes arrive from the API.
+
+        Time-to-first-audio becomes O(first network chunk) rather than
+        O(full utterance): the header is parsed incrementally, then each
+        block is converted (float32 WAVs) or forwarded (PCM16) as-is.
+        """
         text = preprocess_tts_text(text)
         if not text:
-            return np.zeros(0, dtype=np.float32)
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                f"{self.base_url}/audio/speech",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "input": text,
-                    "voice": self.voice,
-                    "response_format": "wav",
-                },
-            )
+            return
+
+        async with self._client.stream(
+            "POST",
+            f"{self.base_url}/audio/speech",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "input": text,
+                "voice": self.voice,
+                "response_format": "wav",
+            },
+        ) as resp:
             resp.raise_for_status()
 
-            # Parse WAV response to numpy
-            wav_buffer = io.BytesIO(resp.content)
-            audio: np.ndarray = sf.read(wav_buffer, dtype="float32")[0]
-            return audio
+            header = bytearray()
+            audio_format = 1
+            sample_width = 2
+            carry = b""
+            in_data = False
+            async for block in resp.aiter_bytes(chunk_size=8192):
+                if not in_data:
+                    header += block
+                    parsed = _parse_wav_header(bytes(header))
+                    if parsed is None:
+                        continue
+                    audio_format, sample_width, data_start = parsed
+                    block = bytes(header[data_start:])
+                    in_data = True
+                # Keep sample-boundary leftovers for the next block
+                block = carry + block
+                usable = len(block) - (len(block) % sample_width)
+                carry = block[usable:]
+                block = block[:usable]
+                if not block:
+                    continue
+                if audio_format == 3:  # IEEE float WAV → int16
+                    yield _to_pcm16(np.frombuffer(block, dtype=np.float32).copy())
+                else:
+                    yield block
+
+
+class CachedTTS(TTSEngine):
+    """LRU audio cache in front of a real engine.
+
+    Boilerplate replies ("I didn't catch that...") recur constantly —
+    a hit skips the synthesis round-trip entirely. Keys hash the
+    cleaned text, so formatting-only differences share an entry.
+    """
+
+    _MAX_ENTRIES = 64
+
+    def __init__(self, engine: TTSEngine):
+        self._engine = engine
+        self._cache: OrderedDict[bytes, bytes] = OrderedDict()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return blake2b(preprocess_tts_text(text).encode(), digest_size=16).digest()
+
+    def _store(self, key: bytes, audio: bytes) -> None:
+        self._cache[key] = audio
+        if len(self._cache) > self._MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    async def synthesize(self, text: str) -> bytes:
+        key = self._key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        audio = await self._engine.synthesize(text)
+        self._store(key, audio)
+        return audio
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        key = self._key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            if cached:
+                yield cached
+            return
+        # Miss: forward blocks as they arrive, cache the joined result
+        blocks = []
+        async for block in self._engine.synthesize_stream(text):
+            blocks.append(block)
+            yield block
+        self._store(key, b"".join(blocks))
+
+    async def aclose(self) -> None:
+        await self._engine.aclose()
+
+    async def warmup(self) -> None:
+        await self._engine.warmup()
 
 
 class NoopTTS(TTSEngine):
     """Silent TTS that returns empty audio — used when TTS is disabled."""
 
-    async def synthesize(self, text: str) -> np.ndarray:
-        return np.zeros(0, dtype=np.float32)
+    async def synthesize(self, text: str) -> bytes:
+        return b""
 
 
 class LocalTTS(TTSEngine):
     """Placeholder for local NeMo FastPitch + HiFi-GAN inference."""
 
-    async def synthesize(self, text: str) -> np.ndarray:
+    async def synthesize(self, text: str) -> bytes:
         raise NotImplementedError("Local TTS not yet implemented — use API mode")
 
 
@@ -88,5 +258,5 @@ async def create_tts(config: TTSConfig) -> TTSEngine:
     if config.backend == "disabled":
         return NoopTTS()
     if config.backend == "api":
-        return RivaTTSAPI(config)
+        return CachedTTS(RivaTTSAPI(config))
     return LocalTTS()